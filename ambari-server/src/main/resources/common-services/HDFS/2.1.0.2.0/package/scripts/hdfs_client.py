@@ -27,12 +27,18 @@ from hdfs import hdfs
 from ambari_commons.os_family_impl import OsFamilyImpl
 from ambari_commons import OSConst
 
+_CORE_SITE_EXPECTATIONS = build_expectations('core-site',
+                                             {"hadoop.security.authentication": "kerberos",
+                                              "hadoop.security.authorization": "true"},
+                                             ["hadoop.security.auth_to_local"],
+                                             None)
+_HDFS_EXPECTATIONS = dict(_CORE_SITE_EXPECTATIONS)
+
 class HdfsClient(Script):
 
   def install(self, env):
     import params
     self.install_packages(env, params.exclude_packages)
-    env.set_params(params)
     self.configure(env)
 
   def configure(self, env):
@@ -41,12 +47,10 @@ class HdfsClient(Script):
     hdfs()
 
   def start(self, env, upgrade_type=None):
-    import params
-    env.set_params(params)
+    pass
 
   def stop(self, env, upgrade_type=None):
-    import params
-    env.set_params(params)
+    pass
 
   def status(self, env):
     raise ClientComponentHasNoStatus()
@@ -68,21 +72,12 @@ class HdfsClientDefault(HdfsClient):
     import status_params
     env.set_params(status_params)
 
-    props_value_check = {"hadoop.security.authentication": "kerberos",
-                         "hadoop.security.authorization": "true"}
-    props_empty_check = ["hadoop.security.auth_to_local"]
-    props_read_check = None
-    core_site_expectations = build_expectations('core-site', props_value_check, props_empty_check,
-                                                props_read_check)
-    hdfs_expectations ={}
-    hdfs_expectations.update(core_site_expectations)
-
     security_params = get_params_from_filesystem(status_params.hadoop_conf_dir,
                                                    {'core-site.xml': FILE_TYPE_XML})
 
     if 'core-site' in security_params and 'hadoop.security.authentication' in security_params['core-site'] and \
         security_params['core-site']['hadoop.security.authentication'].lower() == 'kerberos':
-      result_issues = validate_security_config_properties(security_params, hdfs_expectations)
+      result_issues = validate_security_config_properties(security_params, _HDFS_EXPECTATIONS)
       if not result_issues: # If all validations passed successfully
         if status_params.hdfs_user_principal or status_params.hdfs_user_keytab:
           try:
@@ -94,17 +89,16 @@ class HdfsClientDefault(HdfsClient):
                        status_params.tmp_dir)
             self.put_structured_out({"securityState": "SECURED_KERBEROS"})
           except Exception as e:
-            self.put_structured_out({"securityState": "ERROR"})
-            self.put_structured_out({"securityStateErrorInfo": str(e)})
+            self.put_structured_out({"securityState": "ERROR",
+                                     "securityStateErrorInfo": str(e)})
         else:
-          self.put_structured_out({"securityIssuesFound": "hdfs principal and/or keytab file is not specified"})
-          self.put_structured_out({"securityState": "UNSECURED"})
+          self.put_structured_out({"securityIssuesFound": "hdfs principal and/or keytab file is not specified",
+                                   "securityState": "UNSECURED"})
       else:
-        issues = []
-        for cf in result_issues:
-          issues.append("Configuration file %s did not pass the validation. Reason: %s" % (cf, result_issues[cf]))
-        self.put_structured_out({"securityIssuesFound": ". ".join(issues)})
-        self.put_structured_out({"securityState": "UNSECURED"})
+        issues = ". ".join("Configuration file %s did not pass the validation. Reason: %s" % (cf, reason)
+                           for cf, reason in result_issues.iteritems())
+        self.put_structured_out({"securityIssuesFound": issues,
+                                 "securityState": "UNSECURED"})
 
     else:
       self.put_structured_out({"securityState": "UNSECURED"})
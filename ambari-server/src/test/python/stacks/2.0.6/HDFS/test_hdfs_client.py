@@ -141,6 +141,8 @@ class Test(RMFTestCase):
       )
     except:
       self.assertTrue(True)
+    put_structured_out_mock.assert_called_with({"securityState": "ERROR",
+                                                "securityStateErrorInfo": "Invalid command"})
 
     # Testing when hadoop.security.authentication is simple
     security_params['core-site']['hadoop.security.authentication'] = 'simple'
@@ -173,17 +175,28 @@ class Test(RMFTestCase):
                        hdp_stack_version = self.STACK_VERSION,
                        target = RMFTestCase.TARGET_COMMON_SERVICES
     )
-    put_structured_out_mock.assert_called_with({"securityState": "UNSECURED"})
+    put_structured_out_mock.assert_called_with({"securityIssuesFound": "Configuration file hdfs-site did not pass the validation. Reason: Something bad happened",
+                                                "securityState": "UNSECURED"})
 
     # Testing with empty hdfs_user_principal and hdfs_user_keytab
+    config_file = self.get_src_folder()+"/test/python/stacks/2.0.6/configs/default.json"
+    with open(config_file, "r") as f:
+      json_content = json.load(f)
+    json_content['configurations']['hadoop-env']['hdfs_principal_name'] = ''
+    json_content['configurations']['hadoop-env']['hdfs_user_keytab'] = ''
+
+    validate_security_config_mock.reset_mock()
+    validate_security_config_mock.return_value = {}
+
     self.executeScript(self.COMMON_SERVICES_PACKAGE_DIR + "/scripts/hdfs_client.py",
                        classname = "HdfsClient",
                        command = "security_status",
-                       config_file="default.json",
+                       config_dict = json_content,
                        hdp_stack_version = self.STACK_VERSION,
                        target = RMFTestCase.TARGET_COMMON_SERVICES
     )
-    put_structured_out_mock.assert_called_with({"securityState": "UNSECURED"})
+    put_structured_out_mock.assert_called_with({"securityIssuesFound": "hdfs principal and/or keytab file is not specified",
+                                                "securityState": "UNSECURED"})
 
 
   @patch("resource_management.core.shell.call")
@@ -20,67 +20,34 @@ limitations under the License.
 from mock.mock import MagicMock, call, patch
 from stacks.utils.RMFTestCase import *
 
+# hive and hcatalog conf dirs are both created with the same arguments
+CONF_DIR_ARGS = {
+  'owner': 'hcat',
+  'group': 'hadoop',
+  'recursive': True,
+}
+
 class TestHcatClient(RMFTestCase):
   COMMON_SERVICES_PACKAGE_DIR = "HIVE/0.12.0.2.0/package"
   STACK_VERSION = "2.0.6"
 
   def test_configure_default(self):
+    self.assert_configure("default.json")
+
+  def test_configure_secured(self):
+    self.assert_configure("secured.json")
+
+  def assert_configure(self, config_file):
     self.executeScript(self.COMMON_SERVICES_PACKAGE_DIR + "/scripts/hcat_client.py",
                        classname = "HCatClient",
                        command = "configure",
-                       config_file="default.json",
+                       config_file = config_file,
                        hdp_stack_version = self.STACK_VERSION,
                        target = RMFTestCase.TARGET_COMMON_SERVICES
     )
-    self.assertResourceCalled('Directory', '/etc/hive/conf',
-                              owner = 'hcat',
-                              group = 'hadoop',
-                              recursive = True,
-    )
-    self.assertResourceCalled('Directory', '/etc/hive-hcatalog/conf',
-      owner = 'hcat',
-      group = 'hadoop',
-      recursive = True,
-    )
-    self.assertResourceCalled('Directory', '/var/run/webhcat',
-      owner = 'hcat',
-      recursive = True,
-    )
-    self.assertResourceCalled('XmlConfig', 'hive-site.xml',
-      owner = 'hive',
-      group = 'hadoop',
-      mode = 0644,
-      conf_dir = '/etc/hive/conf',
-      configurations = self.getConfig()['configurations']['hive-site'],
-      configuration_attributes = self.getConfig()['configuration_attributes']['hive-site']
-    )
-    self.assertResourceCalled('File', '/etc/hive-hcatalog/conf/hcat-env.sh',
-                              content = InlineTemplate(self.getConfig()['configurations']['hcat-env']['content']),
-                              owner = 'hcat',
-                              group = 'hadoop',
-                              )
-    self.assertNoMoreResources()
-
-
-
-  def test_configure_secured(self):
-    self.executeScript(self.COMMON_SERVICES_PACKAGE_DIR + "/scripts/hcat_client.py",
-                         classname = "HCatClient",
-                         command = "configure",
-                         config_file="secured.json",
-                         hdp_stack_version = self.STACK_VERSION,
-                         target = RMFTestCase.TARGET_COMMON_SERVICES
-    )
-    self.assertResourceCalled('Directory', '/etc/hive/conf',
-                              recursive = True,
-                              owner = 'hcat',
-                              group = 'hadoop',
-    )
-    self.assertResourceCalled('Directory', '/etc/hive-hcatalog/conf',
-      recursive = True,
-      owner = 'hcat',
-      group = 'hadoop',
-    )
+    config = self.getConfig()
+    self.assertResourceCalled('Directory', '/etc/hive/conf', **CONF_DIR_ARGS)
+    self.assertResourceCalled('Directory', '/etc/hive-hcatalog/conf', **CONF_DIR_ARGS)
     self.assertResourceCalled('Directory', '/var/run/webhcat',
       owner = 'hcat',
       recursive = True,
@@ -90,13 +57,12 @@ class TestHcatClient(RMFTestCase):
       group = 'hadoop',
       mode = 0644,
       conf_dir = '/etc/hive/conf',
-      configurations = self.getConfig()['configurations']['hive-site'],
-      configuration_attributes = self.getConfig()['configuration_attributes']['hive-site']
+      configurations = config['configurations']['hive-site'],
+      configuration_attributes = config['configuration_attributes']['hive-site']
     )
     self.assertResourceCalled('File', '/etc/hive-hcatalog/conf/hcat-env.sh',
-                              content = InlineTemplate(self.getConfig()['configurations']['hcat-env']['content']),
+                              content = InlineTemplate(config['configurations']['hcat-env']['content']),
                               owner = 'hcat',
                               group = 'hadoop',
                               )
-
     self.assertNoMoreResources()